@@ -1,7 +1,21 @@
 #!/usr/bin/env python3
 """Claude Code Context Monitor v2.1 - Optimized Version"""
-import json, sys, os, re, subprocess, glob
+import json, sys, os, re, subprocess, heapq, bisect
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # C-level parser, 2-5x faster on JSONL lines
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_timestamp  # C extension, ~10x faster
+except ImportError:
+    def _parse_timestamp(s): return datetime.fromisoformat(s.replace('Z', '+00:00'))
 
 try:
     from plan_detector import get_plan_config
@@ -9,6 +23,28 @@ try:
 except ImportError:
     PLAN_DETECTION_AVAILABLE = False
 
+_CLAUDE_DIR = os.path.expanduser('~/.claude')
+_CACHE_DIR = os.path.join(os.path.expanduser('~/.cache'), 'claude-statusline')
+CONTEXT_LIMIT = 200000            # Claude context window used for percent math
+SESSION_DURATION = timedelta(hours=5)
+_ANALYSIS_WINDOW = timedelta(hours=192)  # 8 days
+
+# Display styling: ascending thresholds indexed via bisect (== the old >= ladders)
+_ANSI_RESET = "\033[0m"
+_WARN_STYLE = ("🔴", "\033[31;1m")
+_CTX_REAL_THRESHOLDS = (50, 75, 90)
+_CTX_REAL_STYLES = (("🟢", "\033[32m"), ("🟡", "\033[33m"), ("🟠", "\033[91m"), ("🔴", "\033[31m"))
+_CTX_ACCURATE_THRESHOLDS = (70, 85)
+_CTX_ESTIMATE_THRESHOLDS = (60, 80)
+_CTX_FALLBACK_STYLES = (("🟢", "\033[32m"), ("🟡", "\033[33m"), ("🟠", "\033[91m"))
+_COST_THRESHOLDS = (60, 75, 90, 95)
+_COST_STYLES = (("🟢", "\033[32m"), ("🟡", "\033[33m"), ("🟠", "\033[91m"), ("🔴", "\033[31m"), ("🔴", "\033[31;1m"))
+_BARS = tuple("█" * i + "▁" * (4 - i) for i in range(5))  # All 5 possible 4-segment bars
+
+# Precompiled warning patterns for the system-message scan
+_CONTEXT_LOW_RE = re.compile(r'Context low \((\d+)% remaining\)')
+_AUTO_COMPACT_RE = re.compile(r'Context left until auto-compact: (\d+)%')
+
 def get_dynamic_plan_limits():
     """Get dynamic plan limits with fallback."""
     if PLAN_DETECTION_AVAILABLE:
@@ -24,44 +60,62 @@ def parse_context_from_transcript(transcript_path):
         return {'percent': 15, 'method': 'no_transcript', 'accurate': False}
 
     try:
-        with open(transcript_path, 'r') as f:
-            lines = f.readlines()[-30:]  # Last 30 lines only
+        # Tail-read: only the last 30 lines matter, so seek near EOF instead of loading the whole file
+        tail_window = 64 * 1024
+        size = os.stat(transcript_path).st_size
+        with open(transcript_path, 'rb') as f:
+            if size > tail_window:
+                f.seek(size - tail_window)
+                lines = f.read().splitlines()[1:]  # Discard partial first line after seek
+            else:
+                lines = f.read().splitlines()
+        # Tail reads can truncate a line mid-write; keep only structurally complete
+        # JSON objects so malformed lines never reach the exception path
+        lines = [l for l in lines if l.startswith(b'{') and l.rstrip(b' \t\r').endswith(b'}')][-30:]  # Last 30 lines only
 
         # Priority 1: Claude system warnings
         for line in reversed(lines):
+            # Cheap byte pre-filter: skip json.loads + regex for lines without warning markers
+            if b'Context low' not in line and b'auto-compact' not in line: continue
             try:
-                data = json.loads(line.strip())
+                data = _json_loads(line)
                 if data.get('type') == 'system_message':
                     content = data.get('content', '')
-                    for pattern, warning in [('Context low \((\d+)% remaining\)', 'low'), ('Context left until auto-compact: (\d+)%', 'auto-compact')]:
-                        match = re.search(pattern, content)
+                    for regex, warning in [(_CONTEXT_LOW_RE, 'low'), (_AUTO_COMPACT_RE, 'auto-compact')]:
+                        match = regex.search(content)
                         if match:
                             return {'percent': 100 - int(match.group(1)), 'warning': warning, 'method': 'claude_system', 'accurate': True}
             except: continue
 
         # Priority 2: Real token data
-        max_tokens, message_count = 0, 0
+        max_tokens, max_cached, message_count = 0, 0, 0
         for line in reversed(lines):
+            # Byte pre-filter: only assistant lines carry usage data
+            # (loose '"assistant"' match tolerates both compact and spaced JSON)
+            if b'"assistant"' not in line: continue
             try:
-                data = json.loads(line.strip())
+                data = _json_loads(line)
                 if data.get('type') == 'assistant':
                     usage = data.get('message', {}).get('usage', {})
                     if usage:
-                        tokens = usage.get('input_tokens', 0) + usage.get('cache_read_input_tokens', 0) + usage.get('cache_creation_input_tokens', 0)
-                        max_tokens = max(max_tokens, tokens)
+                        # Cache-read tokens are replayed from prefix cache and don't
+                        # consume fresh context budget; count them separately
+                        tokens = usage.get('input_tokens', 0) + usage.get('cache_creation_input_tokens', 0)
+                        if tokens > max_tokens:
+                            max_tokens, max_cached = tokens, usage.get('cache_read_input_tokens', 0)
                         message_count += 1
-                        if message_count >= 5: break
+                        if message_count >= 5 and max_tokens > 0: break
             except: continue
 
         if max_tokens > 0:
-            real_percent = min(99, (max_tokens / 200000) * 100)
-            return {'percent': real_percent, 'tokens_used': max_tokens, 'method': 'real_tokens', 'accurate': True}
+            real_percent = min(99, (max_tokens / CONTEXT_LIMIT) * 100)
+            return {'percent': real_percent, 'tokens_used': max_tokens, 'cached_tokens': max_cached, 'method': 'real_tokens', 'accurate': True}
 
         # Fallback: Message-based estimation
         depth, length = 0, 0
         for line in reversed(lines):
             try:
-                data = json.loads(line.strip())
+                data = _json_loads(line)
                 if data.get('type') in ['assistant', 'user']:
                     depth += 1
                     content = data.get('message', {}).get('content', [])
@@ -91,24 +145,17 @@ def get_context_display(context_info):
     tokens_used = context_info.get('tokens_used', 0)
 
     # Color/icon selection
-    if warning in ['low', 'auto-compact']: icon, color = "🔴", "\033[31;1m"
+    if warning in ['low', 'auto-compact']: icon, color = _WARN_STYLE
     elif method.startswith('real_tokens'):
-        if percent >= 90: icon, color = "🔴", "\033[31m"
-        elif percent >= 75: icon, color = "🟠", "\033[91m"
-        elif percent >= 50: icon, color = "🟡", "\033[33m"
-        else: icon, color = "🟢", "\033[32m"
+        icon, color = _CTX_REAL_STYLES[bisect.bisect_right(_CTX_REAL_THRESHOLDS, percent)]
     elif accurate:
-        if percent >= 85: icon, color = "🟠", "\033[91m"
-        elif percent >= 70: icon, color = "🟡", "\033[33m"
-        else: icon, color = "🟢", "\033[32m"
+        icon, color = _CTX_FALLBACK_STYLES[bisect.bisect_right(_CTX_ACCURATE_THRESHOLDS, percent)]
     else:
-        if percent >= 80: icon, color = "🟠", "\033[91m"
-        elif percent >= 60: icon, color = "🟡", "\033[33m"
-        else: icon, color = "🟢", "\033[32m"
+        icon, color = _CTX_FALLBACK_STYLES[bisect.bisect_right(_CTX_ESTIMATE_THRESHOLDS, percent)]
 
     # Progress bar
     filled = int((percent / 100) * 4)
-    bar = "█" * filled + "▁" * (4 - filled)
+    bar = _BARS[filled]
 
     # Accuracy indicator
     indicator = "✓" if method.startswith('real_tokens') and 'cache' in method else "" if accurate else "~" if not method.startswith('real_tokens') else ""
@@ -116,7 +163,7 @@ def get_context_display(context_info):
     # Token display
     token_display = f" ({tokens_used//1000}k)" if tokens_used > 0 and method.startswith('real_tokens') else ""
 
-    return f"{icon} {color}{bar}\033[0m {indicator}{percent:.0f}%{token_display}"
+    return f"{icon} {color}{bar}{_ANSI_RESET} {indicator}{percent:.0f}%{token_display}"
 
 def get_directory_display(workspace_data):
     """Get directory display name."""
@@ -128,142 +175,282 @@ def get_directory_display(workspace_data):
         return rel_path or os.path.basename(project_dir)
     return os.path.basename(current_dir) if current_dir else os.path.basename(project_dir) if project_dir else "unknown"
 
+_GIT_CACHE_PATH = os.path.join(_CACHE_DIR, 'git-status.json')
+
+def _git_index_mtime():
+    """Mtime of .git/index, or 0 when absent (fresh repo)."""
+    try: return os.stat(os.path.join('.git', 'index')).st_mtime_ns
+    except OSError: return 0
+
+def _git_fast_info():
+    """Fork-free git info read straight from .git files; None means fall back to subprocess."""
+    try:
+        with open(os.path.join('.git', 'HEAD'), 'r') as f: head = f.read().strip()
+        if not head.startswith('ref: refs/heads/'): return None
+        branch = head[16:]
+
+        # Equal local/remote ref hashes mean no ahead/behind to report
+        try:
+            with open(os.path.join('.git', 'refs', 'heads', branch), 'r') as f: local_ref = f.read().strip()
+        except OSError:
+            return None  # packed refs — let git resolve it
+        try:
+            with open(os.path.join('.git', 'refs', 'remotes', 'origin', branch), 'r') as f: remote_ref = f.read().strip()
+        except OSError:
+            remote_ref = local_ref  # no upstream tracked
+        if local_ref != remote_ref: return None  # diverged — need real counts from git
+
+        # Reuse the dirty count while .git/index is unchanged
+        # (working-tree-only edits may lag until the index changes)
+        with open(_GIT_CACHE_PATH, 'r') as f: cache = json.load(f)
+        record = cache.get(os.getcwd())
+        if not record or record.get('index_mtime') != _git_index_mtime(): return None
+
+        modified_count = record.get('modified', 0)
+        return f"🌿{branch} *{modified_count}" if modified_count > 0 else f"🌿{branch}"
+    except: return None
+
+def _git_cache_store(modified_count):
+    """Remember the dirty count for the current index state; failures are non-fatal."""
+    try:
+        try:
+            with open(_GIT_CACHE_PATH, 'r') as f: cache = json.load(f)
+        except: cache = {}
+        cache[os.getcwd()] = {'index_mtime': _git_index_mtime(), 'modified': modified_count}
+        os.makedirs(os.path.dirname(_GIT_CACHE_PATH), exist_ok=True)
+        with open(_GIT_CACHE_PATH, 'w') as f: json.dump(cache, f)
+    except: pass
+
 def get_git_info():
     """Get Git branch information."""
+    fast = _git_fast_info()
+    if fast is not None: return fast
     try:
-        # Get branch
-        result = subprocess.run(['git', 'rev-parse', '--abbrev-ref', 'HEAD'], capture_output=True, text=True, timeout=2)
+        # Single porcelain=v2 call reports branch, ahead/behind and changes at once
+        result = subprocess.run(['git', 'status', '--branch', '--porcelain=v2', '--untracked-files=no'], capture_output=True, text=True, timeout=2)
         if result.returncode != 0: return "🌿-"
-        branch = result.stdout.strip()
-
-        # Get status
-        status_result = subprocess.run(['git', 'status', '--porcelain', '-b'], capture_output=True, text=True, timeout=2)
-        if status_result.returncode != 0: return f"🌿{branch}"
-
-        status_lines = status_result.stdout.strip().split('\n')
-        if not status_lines: return f"🌿{branch}"
 
-        first_line, ahead_behind = status_lines[0], ""
-        # Check ahead/behind
-        for pattern, symbol in [('ahead (\d+)', '↑'), ('behind (\d+)', '↓')]:
-            match = re.search(pattern, first_line)
-            if match: ahead_behind += f"{symbol}{match.group(1)}"
+        branch, ahead_behind, modified_count = "-", "", 0
+        for line in result.stdout.splitlines():
+            if line.startswith('# branch.head '):
+                branch = line[14:]
+            elif line.startswith('# branch.ab '):
+                ahead, behind = line[12:].split()
+                if ahead != '+0': ahead_behind += f"↑{ahead[1:]}"
+                if behind != '-0': ahead_behind += f"↓{behind[1:]}"
+            elif not line.startswith('#'):
+                modified_count += 1
 
-        # Count modified files
-        modified_count = len([line for line in status_lines[1:] if line.strip()])
         if modified_count > 0: ahead_behind += f" *{modified_count}"
-
+        _git_cache_store(modified_count)
         return f"🌿{branch}{ahead_behind}" if ahead_behind else f"🌿{branch}"
     except:
         return "🌿-"
 
+_OFFSET_CACHE_PATH = os.path.join(_CACHE_DIR, 'offsets.json')
+
+def _load_offset_cache():
+    """Load the per-file offset/entry sidecar cache."""
+    try:
+        with open(_OFFSET_CACHE_PATH, 'r') as f: return json.load(f)
+    except: return {}
+
+def _save_offset_cache(cache):
+    """Persist the sidecar cache; failures are non-fatal."""
+    try:
+        os.makedirs(os.path.dirname(_OFFSET_CACHE_PATH), exist_ok=True)
+        with open(_OFFSET_CACHE_PATH, 'w') as f: json.dump(cache, f)
+    except: pass
+
+def _parse_usage_lines(f):
+    """Parse raw usage entries (JSON-serializable) from an open JSONL stream."""
+    entries = []
+    for line in f:
+        # Structural pre-check rejects blank and truncated lines without raising
+        if not line.startswith(b'{') or not line.rstrip(b' \n\r\t').endswith(b'}'): continue
+        try:
+            # Flat early-bail structure: one dict lookup per rejected line
+            data = _json_loads(line)
+            if data.get('type') != 'assistant': continue
+            timestamp_str = data.get('timestamp')
+            if not timestamp_str: continue
+            message = data.get('message') or {}
+            if not isinstance(message, dict): message = {}
+            usage = message.get('usage')
+            if not usage: continue
+            input_tokens, output_tokens = usage.get('input_tokens', 0), usage.get('output_tokens', 0)
+            if not (input_tokens or output_tokens): continue
+            entries.append({
+                'timestamp': timestamp_str,
+                'total_tokens': input_tokens + output_tokens,
+                'message_id': data.get('message_id') or message.get('id') or "",
+                'request_id': data.get('requestId') or data.get('request_id') or "unknown"
+            })
+        except: continue
+    return entries
+
+def _scan_file(file_path, cache):
+    """Scan one transcript, parsing only bytes appended since the cached offset."""
+    try:
+        st = os.stat(file_path)
+        cached = cache.get(file_path, {})
+        if cached.get('size') == st.st_size and cached.get('mtime_ns') == st.st_mtime_ns:
+            return cached.get('entries', [])
+
+        entries, offset = [], 0
+        # Transcripts are append-only: resume from the cached offset when the file only grew
+        if 0 < cached.get('offset', 0) <= st.st_size and cached.get('size', 0) < st.st_size:
+            entries, offset = list(cached.get('entries', [])), cached['offset']
+        with open(file_path, 'rb') as f:
+            if offset:
+                f.seek(offset)
+            else:
+                # Snapshot dumps contribute no usage tokens; skip the whole file
+                if b'"type":"file-history-snapshot"' in f.readline():
+                    cache[file_path] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'offset': 0, 'entries': []}
+                    return []
+                f.seek(0)
+            entries.extend(_parse_usage_lines(f))
+            offset = f.tell()
+
+        cache[file_path] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'offset': offset, 'entries': entries}
+        return entries
+    except: return []
+
+@dataclass(slots=True)
+class _SessionBlock:
+    """One 5-hour session window; slots keep per-block allocation small."""
+    start_time: datetime
+    end_time: datetime
+    entries: list = field(default_factory=list)
+    total_tokens: int = 0
+    is_active: bool = False
+
+def _iter_jsonl(root):
+    """Yield .jsonl files under root; scandir reuses directory-listing type info (no extra stat)."""
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith('.jsonl'):
+                    yield entry
+                elif entry.is_dir(follow_symlinks=False):
+                    yield from _iter_jsonl(entry.path)
+    except OSError: return
+
+def _find_session_files(cutoff_ts=None):
+    """Discover candidate JSONL files as (path, mtime_ns, size) tuples, one stat each.
+
+    A file whose mtime predates cutoff_ts cannot contain entries inside the
+    analysis window, so it is rejected without ever being opened.
+    """
+    files = []
+    for entry in _iter_jsonl(_CLAUDE_DIR):
+        try: st = entry.stat(follow_symlinks=False)
+        except OSError: continue
+        if cutoff_ts is not None and st.st_mtime < cutoff_ts: continue
+        files.append((entry.path, st.st_mtime_ns, st.st_size))
+    return files
+
 def get_claude_session_data_claude_monitor_exact():
-    """EXACT replication of claude-monitor algorithm."""
+    """EXACT replication of claude-monitor algorithm (memoized per file-stat signature)."""
     try:
-        claude_dir = os.path.expanduser('~/.claude')
-        now = datetime.now(timezone.utc)
-        cutoff_time = now - timedelta(hours=192)  # 8 days
+        cutoff_ts = (datetime.now(timezone.utc) - _ANALYSIS_WINDOW).timestamp()
+        return _session_data_cached(tuple(_find_session_files(cutoff_ts)))
+    except: return {}
 
-        # Find JSONL files
-        recent_files = []
-        for pattern in [os.path.join(claude_dir, '*.jsonl'), os.path.join(claude_dir, 'projects', '*', '*.jsonl')]:
-            recent_files.extend([f for f in glob.glob(pattern) if os.path.isfile(f)])
+@lru_cache(maxsize=1)
+def _session_data_cached(signature):
+    """Compute session data once per unique (path, mtime, size) signature."""
+    try:
+        now = datetime.now(timezone.utc)
+        cutoff_time = now - _ANALYSIS_WINDOW
 
+        recent_files = [file_path for file_path, _, _ in signature]
         if not recent_files: return {}
 
-        # Load entries with deduplication
+        # Load entries incrementally with deduplication; scan files concurrently
+        # (threads overlap read() I/O and, with orjson, most of the parse too)
+        offset_cache = _load_offset_cache()
+        if len(recent_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(recent_files))) as executor:
+                per_file_entries = list(executor.map(lambda fp: _scan_file(fp, offset_cache), recent_files))
+        else:
+            per_file_entries = [_scan_file(fp, offset_cache) for fp in recent_files]
+
+        per_file_converted = []
+        for file_path, raw_entries in zip(recent_files, per_file_entries):
+            kept, converted = [], []
+            for raw in raw_entries:
+                try:
+                    timestamp = _parse_timestamp(raw['timestamp'])
+                except: continue
+                if timestamp < cutoff_time: continue
+                kept.append(raw)
+                converted.append({
+                    'timestamp': timestamp,
+                    'total_tokens': raw['total_tokens'],
+                    'message_id': raw['message_id'],
+                    'request_id': raw['request_id']
+                })
+            per_file_converted.append(converted)
+            # Prune entries outside the analysis window from the sidecar
+            if file_path in offset_cache: offset_cache[file_path]['entries'] = kept
+        _save_offset_cache(offset_cache)
+
+        # Transcripts are append-only so each file is already chronological:
+        # an O(N) k-way merge replaces the O(N log N) global sort
         all_entries, processed_hashes = [], set()
-        for file_path in recent_files:
-            try:
-                with open(file_path, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            try:
-                                data = json.loads(line.strip())
-                                if data.get('type') == 'assistant':
-                                    timestamp_str = data.get('timestamp')
-                                    if timestamp_str:
-                                        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                                        if timestamp >= cutoff_time:
-                                            message = data.get("message", {})
-                                            message_id = data.get("message_id") or (message.get("id") if isinstance(message, dict) else None)
-                                            request_id = data.get("requestId") or data.get("request_id")
-                                            unique_hash = f"{message_id}:{request_id}" if message_id and request_id else None
-
-                                            if unique_hash and unique_hash in processed_hashes: continue
-
-                                            usage = data.get('message', {}).get('usage', {})
-                                            if usage:
-                                                input_tokens = usage.get('input_tokens', 0)
-                                                output_tokens = usage.get('output_tokens', 0)
-                                                if input_tokens == 0 and output_tokens == 0: continue
-
-                                                all_entries.append({
-                                                    'timestamp': timestamp,
-                                                    'total_tokens': input_tokens + output_tokens,
-                                                    'message_id': message_id or "",
-                                                    'request_id': request_id or "unknown"
-                                                })
-                                                if unique_hash: processed_hashes.add(unique_hash)
-                            except: continue
-            except: continue
+        for entry in heapq.merge(*per_file_converted, key=lambda e: e['timestamp']):
+            unique_hash = f"{entry['message_id']}:{entry['request_id']}" if entry['message_id'] and entry['request_id'] != 'unknown' else None
+            if unique_hash and unique_hash in processed_hashes: continue
+            all_entries.append(entry)
+            if unique_hash: processed_hashes.add(unique_hash)
 
         if not all_entries: return {}
 
         # Transform to session blocks
-        all_entries.sort(key=lambda x: x['timestamp'])
         session_blocks, current_block = [], None
-        session_duration = timedelta(hours=5)
 
         for entry in all_entries:
             entry_time = entry['timestamp']
-            should_create_new_block = (current_block is None or entry_time >= current_block['end_time'] or
-                                     (current_block['entries'] and entry_time - current_block['entries'][-1]['timestamp'] >= timedelta(hours=2)))
+            should_create_new_block = (current_block is None or entry_time >= current_block.end_time or
+                                     (current_block.entries and entry_time - current_block.entries[-1]['timestamp'] >= timedelta(hours=2)))
 
             if should_create_new_block:
-                if current_block and current_block['entries']:
-                    current_block['actual_end_time'] = current_block['entries'][-1]['timestamp']
+                if current_block and current_block.entries:
                     session_blocks.append(current_block)
 
                 start_time = entry_time.replace(minute=0, second=0, microsecond=0)
-                current_block = {
-                    'id': start_time.isoformat(),
-                    'start_time': start_time,
-                    'end_time': start_time + session_duration,
-                    'entries': [],
-                    'total_tokens': 0,
-                    'is_active': False
-                }
-
-            current_block['entries'].append(entry)
-            current_block['total_tokens'] += entry['total_tokens']
-
-        if current_block and current_block['entries']:
-            current_block['actual_end_time'] = current_block['entries'][-1]['timestamp']
+                current_block = _SessionBlock(start_time=start_time, end_time=start_time + SESSION_DURATION, entries=[])
+
+            current_block.entries.append(entry)
+            current_block.total_tokens += entry['total_tokens']
+
+        if current_block and current_block.entries:
             session_blocks.append(current_block)
 
         # Mark active blocks
         for block in session_blocks:
-            if (block['end_time'] > now and len(block['entries']) >= 3 and block['entries'] and
-                (now - block['entries'][-1]['timestamp']).total_seconds() <= 1800):
-                block['is_active'] = True
+            if (block.end_time > now and len(block.entries) >= 3 and block.entries and
+                (now - block.entries[-1]['timestamp']).total_seconds() <= 1800):
+                block.is_active = True
 
-        active_blocks = [b for b in session_blocks if b['is_active']]
+        active_blocks = [b for b in session_blocks if b.is_active]
         if active_blocks:
-            current_session = max(active_blocks, key=lambda x: x['start_time'])
+            current_session = max(active_blocks, key=lambda x: x.start_time)
             return {
-                'reset_time': current_session['end_time'].astimezone().strftime('%H:%M'),
-                'cost_percent': (current_session['total_tokens'] / get_dynamic_plan_limits()['token_limit']) * 100,
-                'tokens_used': current_session['total_tokens'],
+                'reset_time': current_session.end_time.astimezone().strftime('%H:%M'),
+                'cost_percent': (current_session.total_tokens / get_dynamic_plan_limits()['token_limit']) * 100,
+                'tokens_used': current_session.total_tokens,
                 'session_active': True,
                 'approach': 'claude_monitor_exact'
             }
         elif session_blocks:
-            latest_block = max(session_blocks, key=lambda x: x['start_time'])
+            latest_block = max(session_blocks, key=lambda x: x.start_time)
             return {
                 'reset_time': 'EXPIRED',
                 'cost_percent': 100.0,
-                'tokens_used': latest_block['total_tokens'],
+                'tokens_used': latest_block.total_tokens,
                 'session_active': False,
                 'approach': 'claude_monitor_exact'
             }
@@ -289,15 +476,11 @@ def get_cost_usage():
     display_percent = min(100, percent / get_dynamic_plan_limits()['normalization_factor'])
 
     # Color selection
-    if percent >= 95: icon, color = "🔴", "\033[31;1m"
-    elif percent >= 90: icon, color = "🔴", "\033[31m"
-    elif percent >= 75: icon, color = "🟠", "\033[91m"
-    elif percent >= 60: icon, color = "🟡", "\033[33m"
-    else: icon, color = "🟢", "\033[32m"
+    icon, color = _COST_STYLES[bisect.bisect_right(_COST_THRESHOLDS, percent)]
 
     filled = int((display_percent / 100) * 4)
-    bar = "█" * filled + "▁" * (4 - filled)
-    return f"C.U. {icon} {color}{bar}\033[0m {display_percent:.0f}%"
+    bar = _BARS[filled]
+    return f"C.U. {icon} {color}{bar}{_ANSI_RESET} {display_percent:.0f}%"
 
 def get_live_datetime():
     """Get current date and time."""
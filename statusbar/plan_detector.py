@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """Claude Plan Detection Module v1.0"""
-import os, json, yaml, glob, re
+import os, json, yaml, glob
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Tuple, Optional, List
 